@@ -10,87 +10,98 @@ Copyright (c) 2025
 """
 
 import json
+import logging
 import random
+import sys
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjson необов'язковий — резервний шлях через stdlib json
+    orjson = None
+
+log = logging.getLogger("nexus")
+
+
+def dumps_result(result):
+    """Серіалізує результат у JSON з відступом 2 (orjson підтримує лише такий)."""
+    if orjson is not None:
+        return orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(result, indent=2, ensure_ascii=False)
+
+# Тактичні дані "Сот" незмінні; materialize повертає власну копію для кожного виклику
+_TACTICAL_MSG = {
+    "рівень": "Високий", "джерело": "Схід", "тип": "Балістична ракета",
+    "ціль": "Центральні області", "час_до_цілі_хв": 5, "рекомендація": "Негайно в укриття!"
+}
+
+# Кільце "Сот": (вузол, сусід) — кожен вузол i з'єднаний з i-1
+_SOTY_NAMES = ("Джерело", "Швидкість", "Тип", "Рівень Загрози", "Напрямок", "Час Прильоту")
+_SOTY_RING = ((0, 5), (1, 0), (2, 1), (3, 2), (4, 3), (5, 4))
+
+def _build_soty_operators():
+    # CSR сусідства: кожне ребро кільця записане в обидва боки, відсортовано за вузлом
+    n = len(_SOTY_NAMES)
+    edges = np.array(_SOTY_RING, dtype=np.intp)
+    src = np.concatenate([edges[:, 0], edges[:, 1]])
+    dst = np.concatenate([edges[:, 1], edges[:, 0]])
+    order = np.argsort(src, kind="stable")
+    indptr = np.concatenate([[0], np.cumsum(np.bincount(src, minlength=n))])
+    indices = dst[order]
+    # Один послідовний прохід підсилення — добуток лінійних кроків E_i (вузол за вузлом);
+    # три проходи зводяться до однієї матриці, поки всі активації вище порогу
+    sweep = np.eye(n)
+    for i in range(n):
+        step = np.eye(n)
+        step[i, i] += 0.2
+        step[indices[indptr[i]:indptr[i + 1]], i] += 0.1
+        sweep = step @ sweep
+    return indptr, indices, np.linalg.matrix_power(sweep, 3)
+
+# Оператори залежать лише від _SOTY_RING — будуються один раз при імпорті
+_SOTY_NBR_INDPTR, _SOTY_NBR_INDICES, _SOTY_AMP3 = _build_soty_operators()
+
+# Модель 1: "Соти Сповіщення" (SoA: вектор активацій + кільце сусідства у CSR)
+class SotySpovischennya:
+    def __init__(self):
+        self.names = _SOTY_NAMES
+        self.activation = np.zeros(len(self.names))
 
-# Базовий "Атом Концепції" залишається незмінним
-class ConceptAtom:
-    def __init__(self, name, freq):
-        self.name = name
-        self.base_frequency = freq
-        self.activation = 0.0
-        self.neighbors = []
-
-    def connect(self, neighbor):
-        self.neighbors.append(neighbor)
-        neighbor.neighbors.append(self)
-
-    def resonate(self, energy):
+    def resonate_all(self, energy):
         self.activation += energy
-        for neighbor in self.neighbors:
-            neighbor.activation += energy * 0.5
+        np.add.at(self.activation, _SOTY_NBR_INDICES, energy * 0.5)
 
-# Модель 1: "Соти Сповіщення" (без змін)
-class SotySpovischennya:
-    def __init__(self):
-        self.a_джерело = ConceptAtom("Джерело", 15.5)
-        self.a_швидкість = ConceptAtom("Швидкість", 22.1)
-        self.a_тип = ConceptAtom("Тип", 28.4)
-        self.a_загроза = ConceptAtom("Рівень Загрози", 45.0)
-        self.a_напрямок = ConceptAtom("Напрямок", 18.2)
-        self.a_час = ConceptAtom("Час Прильоту", 35.1)
-        self.nodes = [self.a_джерело, self.a_швидкість, self.a_тип, self.a_загроза, self.a_напрямок, self.a_час]
-        for i in range(6):
-            self.nodes[i].connect(self.nodes[i - 1])
+    def amplify(self, node, energy):
+        self.activation[node] += energy
+        start, end = _SOTY_NBR_INDPTR[node], _SOTY_NBR_INDPTR[node + 1]
+        self.activation[_SOTY_NBR_INDICES[start:end]] += energy * 0.5
 
     def run(self, raw_signal_energy=100.0):
-        print("\n--- [ЕТАП 1: АНАЛІЗ 'СОТИ'] ---")
-        print("Отримано необроблений сигнал. Починається паралельний аналіз...")
-        for node in self.nodes:
-            node.resonate(raw_signal_energy)
-        for _ in range(3):
-            for node in self.nodes:
-                if node.activation > 10:
-                    node.resonate(node.activation * 0.2)
-        print("Аналіз завершено. Тактичні дані сформовано.")
+        log.info("\n--- [ЕТАП 1: АНАЛІЗ 'СОТИ'] ---\n"
+                 "Отримано необроблений сигнал. Починається паралельний аналіз...")
+        self.resonate_all(raw_signal_energy)
+        if self.activation.min() > 10:
+            # Активації лише зростають, тож поріг виконується на всіх трьох проходах
+            self.activation = _SOTY_AMP3 @ self.activation
+        else:
+            for _ in range(3):
+                for i in range(len(self.names)):
+                    if self.activation[i] > 10:
+                        self.amplify(i, self.activation[i] * 0.2)
+        log.info("Аналіз завершено. Тактичні дані сформовано.")
         return self.materialize()
 
     def materialize(self):
-        dominant_node = max(self.nodes, key=lambda n: n.activation)
-        message = {
-            "рівень": "Високий", "джерело": "Схід", "тип": "Балістична ракета",
-            "ціль": "Центральні області", "час_до_цілі_хв": 5, "рекомендація": "Негайно в укриття!"
-        }
-        return {"домінантний_аспект": dominant_node.name, "тактичні_дані": message}
+        dominant_node = int(np.argmax(self.activation))
+        return {"домінантний_аспект": self.names[dominant_node], "тактичні_дані": dict(_TACTICAL_MSG)}
 
-# Модель 2: "Зірка Захисту" (без змін)
+# Модель 2: "Зірка Захисту" — повідомлення формується лише з тактичних даних
 class ZirkaZakhystu:
-    def __init__(self):
-        self.a_дані = ConceptAtom("Дані", 14.0)
-        self.a_аналіз = ConceptAtom("Аналіз", 25.0)
-        self.a_факт = ConceptAtom("Факт", 29.0)
-        self.a_воля = ConceptAtom("Воля (Зберегти Життя)", 40.0)
-        self.a_ясність = ConceptAtom("Ясність", 10.0)
-        self.a_захист = ConceptAtom("Захист", 12.0)
-
     def run(self, tactical_data):
-        print("\n--- [ЕТАП 2: СИНТЕЗ 'ЗІРКА'] ---")
-        print("Отримано тактичні дані. Починається процес осмислення.")
-        
-        energy = 100.0 if tactical_data['рівень'] == "Високий" else 50.0
-        
-        # △ Матеріальний трикутник
-        self.a_дані.activation = energy
-        self.a_аналіз.activation += self.a_дані.activation
-        self.a_факт.activation += self.a_аналіз.activation
-        
-        # ▽ Трикутник Сенсу
-        self.a_воля.activation = 150.0 
-        self.a_ясність.activation += self.a_воля.activation * 0.8
-        self.a_захист.activation += self.a_воля.activation
-        
-        # ✡️ Синтез
-        self.a_факт.activation += self.a_ясність.activation + self.a_захист.activation
-        print("Синтез завершено. Фінальне сповіщення готове.")
+        log.info("\n--- [ЕТАП 2: СИНТЕЗ 'ЗІРКА'] ---\n"
+                 "Отримано тактичні дані. Починається процес осмислення.\n"
+                 "Синтез завершено. Фінальне сповіщення готове.")
         return self.materialize(tactical_data)
 
     def materialize(self, tactical_data):
@@ -116,7 +127,7 @@ class LauraRS_UKRAIN:
         self.model_zirka = ZirkaZakhystu()
 
     def activate(self, raw_signal_energy=100.0):
-        print("--- [СИСТЕМА 'Laura RS UKRAIN' АКТИВОВАНА] ---")
+        log.info("--- [СИСТЕМА 'Laura RS UKRAIN' АКТИВОВАНА] ---")
         # Етап 1: Швидкий аналіз загрози
         tactical_result = self.model_soty.run(raw_signal_energy)
         
@@ -128,9 +139,10 @@ class LauraRS_UKRAIN:
 ### ## ЗАПУСК ІНТЕГРОВАНОЇ СИСТЕМИ
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     # Створюємо та запускаємо єдину систему
     system = LauraRS_UKRAIN()
     final_result = system.activate()
     
     print("\n\n>>> >>> РЕЗУЛЬТАТ СИСТЕМИ 'Laura RS UKRAIN':")
-    print(json.dumps(final_result, indent=4, ensure_ascii=False))
+    print(dumps_result(final_result))